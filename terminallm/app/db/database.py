@@ -44,8 +44,8 @@ class Database:
         cursor = connection.cursor()
         status = True
         created_at = datetime.now().isoformat()  # Current datetime in ISO format
-        chat_history = json.dumps(chat_history)  # Chat history as JSON
-        llm_config = json.dumps(llm_config)  # LLM configuration as JSON
+        chat_history = json.dumps(chat_history, separators=(",", ":"))  # Chat history as compact JSON
+        llm_config = json.dumps(llm_config, separators=(",", ":"))  # LLM configuration as compact JSON
         try:
             # Insert data into the users table
             cursor.execute(
@@ -52,7 +52,7 @@ class DevAssisast(BaseApp):
             write_file,
         ]:
             if not callable(fitem):
-                logger.warning(f"{fitem} is not a valid functions ...")
+                logger.warning("%s is not a valid functions ...", fitem)
             f_map[fitem.__name__] = fitem
             f_signature = get_function_schema(fitem, name=fitem.__name__)
             tools.append(f_signature)
@@ -4,11 +4,11 @@ from typing import Any, Optional
 
 import pyttsx3
 import speech_recognition
-from litellm import CustomStreamWrapper, stream_chunk_builder
+from litellm import CustomStreamWrapper
 from termcolor._types import Color
 
 from .base import InputDevice, OutputDevice
-from .utility import modify_logger_behaviour
+from .utility import log_stream_response, modify_logger_behaviour
 
 logger = logging.getLogger(__name__)
 
@@ -78,14 +78,7 @@ class Speaker(OutputDevice):
 
     def deliver_stream_response(self, response: CustomStreamWrapper) -> Optional[str]:
         self.logger.info("Response: - \n\t", extra={"color": "yellow"})
-        chunks = []
-        for chunk in response:
-            chunks.append(chunk)
-            content = chunk.choices[0].delta.content
-            content = "" if content is None else content
-            self.logger.info(content, extra={"color": "green"})
-        message_final = stream_chunk_builder(chunks, messages=None)
-        reply_msg = message_final.choices[0].message.content
+        reply_msg = log_stream_response(self.logger, response)
         self.logger.info("\n")
         self.engine.say(reply_msg)
         self.engine.runAndWait()
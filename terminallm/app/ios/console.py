@@ -1,11 +1,11 @@
 import logging
 from typing import Any, Optional
 
-from litellm import CustomStreamWrapper, stream_chunk_builder
+from litellm import CustomStreamWrapper
 from termcolor._types import Color
 
 from .base import InputDevice, OutputDevice
-from .utility import modify_logger_behaviour
+from .utility import log_stream_response, modify_logger_behaviour
 
 logger = logging.getLogger(__name__)
 
@@ -20,13 +20,7 @@ class Console(InputDevice, OutputDevice):
 
     def deliver_stream_response(self, response: CustomStreamWrapper) -> Optional[str]:
         self.logger.info("Response: - \n\t", extra={"color": "yellow"})
-        chunks = []
-        for chunk in response:
-            chunks.append(chunk)
-            content = chunk.choices[0].delta.content
-            self.logger.info(content, extra={"color": "green"})
-        message_final = stream_chunk_builder(chunks, messages=None)
-        reply_msg = message_final.choices[0].message.content
+        reply_msg = log_stream_response(self.logger, response)
         self.logger.info("\n")
         return reply_msg
 
@@ -1,9 +1,12 @@
-from .audio import MicroPhone, Speaker
 from .base import InputDevice, OutputDevice
 from .console import Console
 
 
 def build_io_devices(mode: str) -> tuple[InputDevice, OutputDevice]:
+    # The audio devices import the speech engines, only load them for the modes that use them
+    if mode.lower() in ("ms", "mt", "ts"):
+        from .audio import MicroPhone, Speaker  # noqa: PLC0415
+
     if mode.lower() == "tt":
         inputd = Console()
         outputd = Console()
@@ -1,17 +1,47 @@
 import logging
+from collections.abc import Iterable
+from functools import cache
+from typing import Any
 
 from termcolor import colored
 
+_FILE_HANDLERS: dict[str, logging.FileHandler] = {}
+
+
+@cache
+def _color_codes(color: str) -> tuple[str, str]:
+    # colored() checks the environment and isatty() on every call, resolve the escape codes once per color
+    prefix, _, suffix = colored("\0", color).partition("\0")
+    return prefix, suffix
+
 
 class ColorFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         color = getattr(record, "color", None)
         message = super().format(record)
         if color:
-            message = colored(message, color)
+            prefix, suffix = _color_codes(color)
+            message = f"{prefix}{message}{suffix}"
         return message
 
 
+def _get_file_handler(handler_r: logging.FileHandler) -> logging.FileHandler:
+    # Device loggers share one handler per log file instead of opening the file again on every call
+    new_handler = _FILE_HANDLERS.get(handler_r.baseFilename)
+    if new_handler is None:
+        new_handler = logging.FileHandler(
+            handler_r.baseFilename,
+            handler_r.mode,
+            handler_r.encoding,
+            handler_r.delay,
+            handler_r.errors,
+        )
+        new_handler.terminator = ""
+        new_handler.setFormatter(logging.Formatter("%(message)s"))
+        _FILE_HANDLERS[handler_r.baseFilename] = new_handler
+    return new_handler
+
+
 def modify_logger_behaviour(name: str) -> logging.Logger:
     root_handlers = logging.getLogger().handlers
     current_logger = logging.getLogger(name)
@@ -35,17 +65,24 @@ def modify_logger_behaviour(name: str) -> logging.Logger:
             new_handler.setFormatter(ColorFormatter("%(message)s"))
             current_logger.addHandler(new_handler)
         elif type(handler_r) is logging.FileHandler:
-            new_handler = logging.FileHandler(
-                handler_r.baseFilename,
-                handler_r.mode,
-                handler_r.encoding,
-                handler_r.delay,
-                handler_r.errors,
-            )
-            new_handler.terminator = ""
-            new_handler.setFormatter(logging.Formatter("%(message)s"))
-            current_logger.addHandler(new_handler)
+            current_logger.addHandler(_get_file_handler(handler_r))
         else:
             continue
     current_logger.propagate = False
     return current_logger
+
+
+def log_stream_response(stream_logger: logging.Logger, response: Iterable[Any]) -> str:
+    # Shared by the output devices: writes each delta as it arrives and returns the full reply
+    content_parts = []
+    for chunk in response:
+        # Keep-alive and usage-only chunks carry no choices or an empty delta, skip them early
+        if not chunk.choices:
+            continue
+        content = chunk.choices[0].delta.content
+        if not content:
+            continue
+        content_parts.append(content)
+        stream_logger.info(content, extra={"color": "green"})
+    # The reply is rebuilt from the streamed deltas, no need to keep every chunk for stream_chunk_builder
+    return "".join(content_parts)
@@ -11,8 +11,13 @@ from .ios.base import InputDevice, OutputDevice
 
 logger = logging.getLogger(__name__)
 
+# Static tail of the per-turn prompt, colored once instead of on every turn
+_QUIT_HINT = colored(" | ", "light_blue") + colored("enter <q:> to quit -\n\t", "yellow")
+
 
 class QnaEnginee(BaseEngine):
+    _max_tokens: int | str
+
     def __init__(
         self,
         input_device: InputDevice,
@@ -23,6 +28,11 @@ class QnaEnginee(BaseEngine):
 
     def _configure_llm(self) -> None:
         self._llm_config = get_llm_config(self._client_name)
+        # The model's token limit does not change between turns, look it up once per session
+        try:
+            self._max_tokens = get_max_tokens(self._client_name)
+        except Exception:
+            self._max_tokens = "NONE"
 
     def _send_to_llm(self) -> str | None:
         # chunks = []
@@ -52,15 +62,7 @@ class QnaEnginee(BaseEngine):
 
     def _ask_for_next_query(self) -> None:
         token_used = token_counter(model=self._client_name, messages=self._chat_history)
-        try:
-            max_tokens = get_max_tokens(self._client_name)
-        except Exception:
-            max_tokens = "NONE"
-        message = (
-            colored(f"\nTokens Used: {token_used} / {max_tokens}", "light_red")
-            + colored(" | ", "light_blue")
-            + colored("enter <q:> to quit -\n\t", "yellow")
-        )
+        message = colored(f"\nTokens Used: {token_used} / {self._max_tokens}", "light_red") + _QUIT_HINT
         self._output_device.deliver_message(message)
 
     def run(self, new: bool = True) -> NoReturn:
@@ -1,8 +1,33 @@
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Annotated, Optional
 
 from pathspec import PathSpec, patterns
 
+_GLOB_CHARS = frozenset("*?[")
+_BINARY_CHECK_SIZE = 8192
+_MAX_READ_SIZE = 10 * 1024 * 1024
+
+
+def _is_literal_name(name: str) -> bool:
+    """Check if `name` is a plain file name, so pathlib can probe for it instead of matching every entry."""
+    return name not in ("", ".", "..") and Path(name).name == name and not _GLOB_CHARS.intersection(name)
+
+
+def _has_exact_name(path: Path) -> bool:
+    """Check that `path` is spelled as on disk; probed literal names match any case on case-insensitive filesystems."""
+    return path.name in os.listdir(path.parent)  # noqa: PTH208
+
+
+@lru_cache(maxsize=32)
+def _load_gitignore_spec(gitignore_path: str, mtime_ns: int) -> PathSpec:  # noqa: ARG001
+    """Compile the patterns of a .gitignore, cached until the file is modified."""
+    with open(gitignore_path, "r") as f:
+        lines = f.read().splitlines()
+    lines.append(".git")
+    return PathSpec.from_lines(pattern_factory=patterns.GitWildMatchPattern, lines=lines)
+
 
 def list_files(directory: Annotated[str, "The directory to list files from"]) -> str:
     """
@@ -15,20 +40,26 @@ def list_files(directory: Annotated[str, "The directory to list files from"]) ->
     Returns:
     str: A list of absolute file paths separated by comma if the directory has files, else returns `No files found`.
     """
-    path = Path(directory)
-    gitignore_path = path / ".gitignore"
-    if gitignore_path.exists():
-        with open(gitignore_path, "r") as f:
-            lines = f.readlines()
-            lines.append(".git")
-            spec = PathSpec.from_lines(pattern_factory=patterns.GitWildMatchPattern, lines=lines)
-        file_list = [
-            str(file.resolve())
-            for file in path.rglob("*")
-            if file.is_file() and not spec.match_file(str(file.relative_to(path)))
-        ]
+    root = str(Path(directory).resolve())
+    gitignore_path = Path(root) / ".gitignore"
+    try:
+        gitignore_mtime = gitignore_path.stat().st_mtime_ns
+    except OSError:
+        spec = None
     else:
-        file_list = [str(file.resolve()) for file in path.rglob("*") if file.is_file()]
+        spec = _load_gitignore_spec(str(gitignore_path), gitignore_mtime)
+
+    file_list = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        if spec is not None:
+            # Entries are matched relative to the root: one relpath per directory, plain joins below it
+            rel_dir = os.path.relpath(dirpath, root)
+            # Prune ignored directories in place so os.walk never descends into them
+            dirnames[:] = [name for name in dirnames if not spec.match_file(os.path.join(rel_dir, name) + "/")]  # noqa: PTH118
+            filenames[:] = [name for name in filenames if not spec.match_file(os.path.join(rel_dir, name))]  # noqa: PTH118
+        # os.walk also reports dangling symlinks and special files as files, keep only what is_file() would
+        file_paths = (os.path.join(dirpath, filename) for filename in filenames)  # noqa: PTH118
+        file_list.extend(file_path for file_path in file_paths if os.path.isfile(file_path))  # noqa: PTH113
 
     return "\n, ".join(file_list) if file_list else "No files found"
 
@@ -43,7 +74,8 @@ def get_absolute_path(path_str: Annotated[str, "The path string to get the absol
     Returns:
     str: The absolute path as a string.
     """
-    return str(Path(path_str)) if Path(path_str).is_absolute() else str(Path(path_str).resolve())
+    path = Path(path_str)
+    return str(path) if path.is_absolute() else str(path.resolve())
 
 
 def find_file(
@@ -60,8 +92,11 @@ def find_file(
     Returns:
     str: The absolute path of the file if found, otherwise returns `Error - File {file_name} not found in {directory}`.
     """
-    path = Path(directory)
-    found_results = [file.resolve() for file in path.rglob("*") if file.is_file() and file.name == file_name]
+    path = Path(directory).resolve()
+    candidates = path.rglob(file_name) if _is_literal_name(file_name) else path.rglob("*")
+    found_results = [
+        str(file) for file in candidates if file.is_file() and file.name == file_name and _has_exact_name(file)
+    ]
     if found_results:
         if len(found_results) == 1:
             return found_results[0]
@@ -86,11 +121,12 @@ def find_directory(
     str: The absolute path of the directory if found, otherwise returns
     `Error - Directory {dir_name} not found in {directory}`.
     """
-    path = Path(directory)
+    path = Path(directory).resolve()
     found_results = []
-    for d in path.rglob("*"):
-        if d.is_dir() and d.name == dir_name:
-            return str(d.resolve())
+    candidates = path.rglob(dir_name) if _is_literal_name(dir_name) else path.rglob("*")
+    for d in candidates:
+        if d.is_dir() and d.name == dir_name and _has_exact_name(d):
+            return str(d)
     if found_results:
         if len(found_results) == 1:
             return found_results[0]
@@ -111,8 +147,16 @@ def read_file(file_path: Annotated[str, "The absolute path to the file to read"]
     str: returns the content of the file if it exists, otherwise returns `Error - {error message}`.
     """
     try:
-        with open(file_path, "r") as file:
-            return file.read()
+        with open(file_path, "rb") as file:
+            file_size = os.fstat(file.fileno()).st_size
+            if file_size > _MAX_READ_SIZE:
+                return f"Error - {file_path} is too large to read ({file_size} bytes)"
+            head = file.read(_BINARY_CHECK_SIZE)
+            if b"\x00" in head:
+                return f"Error - {file_path} is a binary file"
+            data = head + file.read()
+        # Decode strictly and translate newlines like text mode, so write_file round-trips the content
+        return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
     except Exception as err:
         return f"Error - {err!s}"
 
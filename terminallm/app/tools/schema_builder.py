@@ -284,15 +284,18 @@ def get_function_schema(f: Callable[..., Any], *, name: Optional[str] = None) ->
 
     if return_annotation is None:
         logger.warning(
-            f"""The return type of the function '{f.__name__}' is not annotated. Although annotating it is
-            optional, the function should return either a string, a subclass of 'pydantic.BaseModel'."""
+            """The return type of the function '%s' is not annotated. Although annotating it is
+            optional, the function should return either a string, a subclass of 'pydantic.BaseModel'.""",
+            f.__name__,
         )
 
     if unannotated_with_default != set():
         unannotated_with_default_s = [f"'{k}'" for k in sorted(unannotated_with_default)]
         logger.warning(
-            f"""The following parameters of the function '{f.__name__}' with default values are not annotated:
-            {", ".join(unannotated_with_default_s)}."""
+            """The following parameters of the function '%s' with default values are not annotated:
+            %s.""",
+            f.__name__,
+            ", ".join(unannotated_with_default_s),
         )
 
     if missing != set():
@@ -5,7 +5,6 @@ from typing import NoReturn
 
 from dotenv import load_dotenv
 
-from .app.factory import build_app
 from .utility import get_version, llm_config_path
 
 logging.basicConfig(
@@ -52,6 +51,9 @@ def main() -> NoReturn:
         # litellm.set_verbose = True
         logging.getLogger("LiteLLM").setLevel(logging.INFO)
 
+    # Imported here as the app pulls in litellm, which takes seconds to load and isn't needed for --help/--version
+    from .app.factory import build_app  # noqa: PLC0415
+
     try:
         app = build_app(mode=args.mode, client_name=args.llm)
         app.run()
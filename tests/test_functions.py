@@ -0,0 +1,86 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from terminallm.app.tools import functions
+from terminallm.app.tools.functions import find_directory, find_file, list_files, read_file
+
+
+# ruff: noqa
+class TestFunctions(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name).resolve()
+        (self.root / ".git").mkdir()
+        (self.root / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        (self.root / "build").mkdir()
+        (self.root / "build" / "out.bin").write_text("binary")
+        (self.root / "src" / "pkg").mkdir(parents=True)
+        (self.root / "src" / "pkg" / "module.py").write_text("print('hello')\n")
+        (self.root / "debug.log").write_text("log")
+        (self.root / ".gitignore").write_text("*.log\nbuild/\n")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_list_files_respects_gitignore(self):
+        files = list_files(str(self.root)).split("\n, ")
+        self.assertCountEqual(files, [str(self.root / ".gitignore"), str(self.root / "src" / "pkg" / "module.py")])
+
+    def test_list_files_without_gitignore(self):
+        (self.root / ".gitignore").unlink()
+        files = list_files(str(self.root)).split("\n, ")
+        self.assertIn(str(self.root / ".git" / "HEAD"), files)
+        self.assertIn(str(self.root / "build" / "out.bin"), files)
+        self.assertEqual(len(files), 4)
+
+    def test_list_files_skips_dangling_symlinks(self):
+        (self.root / "src" / "dangling").symlink_to(self.root / "missing.py")
+        files = list_files(str(self.root)).split("\n, ")
+        self.assertNotIn(str(self.root / "src" / "dangling"), files)
+        self.assertEqual(len(files), 2)
+
+    def test_list_files_empty_directory(self):
+        with tempfile.TemporaryDirectory() as empty_dir:
+            self.assertEqual(list_files(empty_dir), "No files found")
+
+    def test_find_file(self):
+        self.assertEqual(find_file("module.py", str(self.root)), str(self.root / "src" / "pkg" / "module.py"))
+        self.assertTrue(find_file("missing.py", str(self.root)).startswith("Error - File missing.py not found"))
+
+    def test_find_file_requires_exact_case(self):
+        # Simulate a case-insensitive filesystem, where probing "readme.md" succeeds for README.md
+        (self.root / "readme.md").write_text("docs")
+        with mock.patch.object(functions.os, "listdir", return_value=["README.md"]):
+            self.assertTrue(find_file("readme.md", str(self.root)).startswith("Error - File readme.md not found"))
+            self.assertTrue(find_directory("src", str(self.root)).startswith("Error - Directory src not found"))
+
+    def test_find_directory(self):
+        self.assertEqual(find_directory("pkg", str(self.root)), str(self.root / "src" / "pkg"))
+        self.assertTrue(find_directory("missing", str(self.root)).startswith("Error - Directory missing not found"))
+
+    def test_read_file(self):
+        self.assertEqual(read_file(str(self.root / "src" / "pkg" / "module.py")), "print('hello')\n")
+        self.assertTrue(read_file(str(self.root / "missing.py")).startswith("Error - "))
+
+    def test_read_file_binary(self):
+        (self.root / "data.bin").write_bytes(b"header\x00\x01\x02")
+        self.assertEqual(read_file(str(self.root / "data.bin")), f"Error - {self.root / 'data.bin'} is a binary file")
+
+    def test_read_file_normalizes_newlines(self):
+        (self.root / "crlf.txt").write_bytes(b"a\r\nb\r\n")
+        self.assertEqual(read_file(str(self.root / "crlf.txt")), "a\nb\n")
+
+    def test_read_file_non_utf8(self):
+        (self.root / "latin1.txt").write_bytes("caf\xe9".encode("latin-1"))
+        self.assertTrue(read_file(str(self.root / "latin1.txt")).startswith("Error - 'utf-8' codec can't decode"))
+
+    def test_read_file_too_large(self):
+        file_path = self.root / "src" / "pkg" / "module.py"
+        with mock.patch.object(functions, "_MAX_READ_SIZE", 4):
+            self.assertEqual(read_file(str(file_path)), f"Error - {file_path} is too large to read (15 bytes)")
+
+
+if __name__ == "__main__":
+    unittest.main()
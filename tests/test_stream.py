@@ -0,0 +1,37 @@
+import unittest
+from unittest import mock
+
+from litellm.types.utils import Delta, ModelResponseStream, StreamingChoices
+
+from terminallm.app.ios.utility import log_stream_response
+
+
+def make_chunk(content):
+    return ModelResponseStream(
+        choices=[StreamingChoices(delta=Delta(content=content, role="assistant"), index=0)], model="gpt-4o"
+    )
+
+
+# ruff: noqa
+class TestLogStreamResponse(unittest.TestCase):
+    def test_reply_is_rebuilt_from_deltas(self):
+        logger = mock.Mock()
+        chunks = [make_chunk("Hello"), make_chunk(" world"), make_chunk(None)]
+        self.assertEqual(log_stream_response(logger, chunks), "Hello world")
+
+    def test_each_delta_is_written_as_it_arrives(self):
+        logger = mock.Mock()
+        chunks = [make_chunk("Hel"), make_chunk(None), make_chunk("lo"), make_chunk(" there\n")]
+        log_stream_response(logger, chunks)
+        written = [call.args[0] for call in logger.info.call_args_list]
+        self.assertEqual(written, ["Hel", "lo", " there\n"])
+
+    def test_chunks_without_choices_are_skipped(self):
+        logger = mock.Mock()
+        empty_chunk = ModelResponseStream(model="gpt-4o")
+        empty_chunk.choices = []
+        self.assertEqual(log_stream_response(logger, [empty_chunk, make_chunk("ok")]), "ok")
+
+
+if __name__ == "__main__":
+    unittest.main()